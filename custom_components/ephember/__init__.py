@@ -2,22 +2,206 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 import logging
+import random
+import threading
+from typing import Any
 
 from pyephember2.pyephember2 import EphEmber
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    EVENT_HOMEASSISTANT_STOP,
+    Platform,
+)
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN
+# Applies the remaining pyephember2 fixes and speedups on import
+from . import pyephember2_patches  # noqa: F401
+from .batcher import ZoneCommandBatcher
+from .const import DOMAIN, REFRESH_COOLDOWN, SCAN_INTERVAL, SCAN_JITTER
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.CLIMATE]
 
-type EphemberConfigEntry = ConfigEntry[EphEmber]
+type EphemberConfigEntry = ConfigEntry[EphemberCoordinator]
+
+# Errors raised by pyephember2 when the login or the first fetch fails
+CONNECT_ERRORS = (RuntimeError, requests.exceptions.RequestException)
+
+_original_http = EphEmber._http
+
+
+def _patched_http(self, endpoint, *, method=requests.post, **kwargs):
+    """Patched version of _http that reuses a pooled requests.Session.
+
+    The original pyephember2 library calls requests.get/requests.post
+    directly, which opens a new TCP+TLS connection for every request.
+    When a session has been attached to the client, route the call through
+    it so the connection to the EPH cloud is kept alive between polls.
+    """
+    session = getattr(self, "_session", None)
+    if session is not None and method in (requests.get, requests.post):
+        method = getattr(session, method.__name__)
+    return _original_http(self, endpoint, method=method, **kwargs)
+
+
+# Monkey-patch pyephember2 to support a shared session
+EphEmber._http = _patched_http
+
+
+def _create_session() -> requests.Session:
+    """Create a keep-alive session with a small pool for the EPH cloud."""
+    session = requests.Session()
+    session.headers["Connection"] = "keep-alive"
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=4,
+            # Don't retry read timeouts, so one request can't hold the API
+            # lock across several of the library's 10 s timeouts
+            max_retries=Retry(
+                total=2,
+                read=0,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=None,
+                raise_on_status=False,
+            ),
+        ),
+    )
+    return session
+
+
+def _zones_by_id(homes: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Flatten the zones of all homes into a dict keyed by zone id."""
+    return {zone["zoneid"]: zone for home in homes for zone in home["zones"]}
+
+
+def _bootstrap(
+    username: str, password: str, session: requests.Session
+) -> tuple[EphEmber, list[dict[str, Any]]]:
+    """Log in and fetch the initial zones in one executor job."""
+    # Attach the session before __init__ logs in, so the login request
+    # already opens the connection that the first fetch then reuses
+    ember = EphEmber.__new__(EphEmber)
+    ember._session = session
+    ember.__init__(username, password)
+    # pyephember2 is not thread-safe; every coordinator built around this
+    # client, including after a reload, serializes access with this lock
+    ember._api_lock = threading.Lock()
+    return ember, ember.get_zones()
+
+
+def _resume(ember: EphEmber) -> list[dict[str, Any]]:
+    """Fetch fresh zones with an already logged-in client."""
+    with ember._api_lock:
+        ember.NextHomeUpdateDaytime = None
+        return ember.get_zones()
+
+
+class EphemberCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]]):
+    """Fetch all zones of an EPH Controls account once per interval."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        ember: EphEmber,
+        config_entry: EphemberConfigEntry | None = None,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=config_entry,
+            name=DOMAIN,
+            # Spread polls of several accounts so they don't hit the cloud at once
+            update_interval=SCAN_INTERVAL
+            + timedelta(seconds=random.uniform(0, SCAN_JITTER)),
+            # Collapse refreshes requested by near-simultaneous commands
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REFRESH_COOLDOWN, immediate=False
+            ),
+        )
+        self.ember = ember
+        self.api_lock = ember._api_lock
+        self.batcher = ZoneCommandBatcher(hass, self.api_lock)
+        self._resync = False
+
+    async def async_request_resync(self) -> None:
+        """Request a refresh that bypasses the pyephember2 home cache."""
+        self._resync = True
+        await self.async_request_refresh()
+
+    def _fetch_zones(self) -> list[dict[str, Any]]:
+        """Fetch all homes, clearing the library cache if a resync is due."""
+        with self.api_lock:
+            # Clear the cache only here, so commands sent in the meantime can
+            # still look up their zone from the library cache without a fetch
+            if self._resync:
+                self._resync = False
+                self.ember.NextHomeUpdateDaytime = None
+            return self.ember.get_zones()
+
+    async def _async_update_data(self) -> dict[str, dict[str, Any]]:
+        """Fetch the zones of all homes, keyed by zone id."""
+        try:
+            homes = await self.hass.async_add_executor_job(self._fetch_zones)
+        except requests.exceptions.RequestException as err:
+            raise UpdateFailed(f"Network error fetching zones: {err}") from err
+        except (TimeoutError, OSError) as err:
+            raise UpdateFailed(f"Connection error fetching zones: {err}") from err
+        except RuntimeError as err:
+            raise UpdateFailed(f"Error fetching zones: {err}") from err
+
+        return _zones_by_id(homes)
+
+
+async def async_create_coordinator(
+    hass: HomeAssistant,
+    username: str,
+    password: str,
+    config_entry: EphemberConfigEntry | None = None,
+    ember: EphEmber | None = None,
+) -> EphemberCoordinator:
+    """Log in and return a coordinator primed with the initial zones.
+
+    If a logged-in ``ember`` client is given, it is reused instead of
+    logging in again. Raises one of CONNECT_ERRORS if the login or the
+    first fetch fails.
+    """
+    if ember is not None:
+        session = ember._session
+        try:
+            homes = await hass.async_add_executor_job(_resume, ember)
+        except BaseException:
+            session.close()
+            raise
+    else:
+        # Reuse the TCP+TLS connection for all subsequent API calls
+        session = _create_session()
+        try:
+            ember, homes = await hass.async_add_executor_job(
+                _bootstrap, username, password, session
+            )
+        except BaseException:
+            session.close()
+            raise
+
+    coordinator = EphemberCoordinator(hass, ember, config_entry)
+    coordinator.async_set_updated_data(_zones_by_id(homes))
+    return coordinator
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: EphemberConfigEntry) -> bool:
@@ -25,13 +209,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: EphemberConfigEntry) ->
     username = entry.data[CONF_USERNAME]
     password = entry.data[CONF_PASSWORD]
 
+    # Reuse the client kept from a previous unload if the credentials match
+    ember = None
+    if (kept := _async_pop_kept_client(hass, entry.entry_id)) is not None:
+        data, ember = kept
+        if data != dict(entry.data):
+            ember._session.close()
+            ember = None
+
     try:
-        ember = await hass.async_add_executor_job(EphEmber, username, password)
-    except RuntimeError as err:
+        coordinator = await async_create_coordinator(
+            hass, username, password, entry, ember
+        )
+    except CONNECT_ERRORS as err:
         raise ConfigEntryNotReady(f"Unable to connect to EPH Controls: {err}") from err
 
-    # Store the client in runtime_data
-    entry.runtime_data = ember
+    # Store the coordinator in runtime_data
+    entry.runtime_data = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -40,4 +234,46 @@ async def async_setup_entry(hass: HomeAssistant, entry: EphemberConfigEntry) ->
 
 async def async_unload_entry(hass: HomeAssistant, entry: EphemberConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        if entry.disabled_by is None and not hass.is_stopping:
+            _async_keep_client(hass, entry)
+        else:
+            entry.runtime_data.ember._session.close()
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: EphemberConfigEntry) -> None:
+    """Close the client kept for a removed config entry."""
+    if (kept := _async_pop_kept_client(hass, entry.entry_id)) is not None:
+        kept[1]._session.close()
+
+
+@callback
+def _async_keep_client(hass: HomeAssistant, entry: EphemberConfigEntry) -> None:
+    """Keep the entry's logged-in client so a reload doesn't log in again."""
+    clients = hass.data.setdefault(DOMAIN, {})
+    ember = entry.runtime_data.ember
+
+    @callback
+    def _async_close(event: Event) -> None:
+        """Close the kept client when Home Assistant stops."""
+        clients.pop(entry.entry_id, None)
+        ember._session.close()
+
+    clients[entry.entry_id] = (
+        dict(entry.data),
+        ember,
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_close),
+    )
+
+
+@callback
+def _async_pop_kept_client(
+    hass: HomeAssistant, entry_id: str
+) -> tuple[dict[str, Any], EphEmber] | None:
+    """Take the client kept for a config entry, if any."""
+    if (kept := hass.data.get(DOMAIN, {}).pop(entry_id, None)) is None:
+        return None
+    data, ember, unsub_stop = kept
+    unsub_stop()
+    return data, ember
@@ -0,0 +1,111 @@
+"""Coalescing of zone commands for the EPH Controls Ember integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import logging
+import threading
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ZoneCommandBatcher:
+    """Collapse commands sent in quick succession into one send per zone.
+
+    Commands are keyed by ``(zone_id, kind)``; a newer command of the same
+    kind replaces a pending one, so only the latest desired state is sent.
+    Pending commands are sent together in a single executor job once
+    ``max_wait_ms`` has passed or ``max_batch`` commands are queued. The
+    job holds ``lock`` so it never overlaps with a zone fetch.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        lock: threading.Lock,
+        max_wait_ms: int = 50,
+        max_batch: int = 8,
+    ) -> None:
+        """Initialize the batcher."""
+        self._hass = hass
+        self._lock = lock
+        self._max_wait = max_wait_ms / 1000
+        self._max_batch = max_batch
+        self._pending: dict[
+            tuple[str, str], tuple[Callable[..., Any], tuple[Any, ...], asyncio.Future]
+        ] = {}
+        self._flush_task: asyncio.Task | None = None
+
+    async def async_submit(
+        self, zone_id: str, kind: str, func: Callable[..., Any], *args: Any
+    ) -> None:
+        """Queue a command and wait until it (or a newer one) has been sent."""
+        key = (zone_id, kind)
+        if key in self._pending:
+            future = self._pending[key][2]
+        else:
+            future = self._hass.loop.create_future()
+        self._pending[key] = (func, args, future)
+
+        if len(self._pending) >= self._max_batch:
+            if self._flush_task is not None:
+                self._flush_task.cancel()
+            self._flush_task = self._hass.async_create_task(self._async_flush(0))
+        elif self._flush_task is None:
+            self._flush_task = self._hass.async_create_task(
+                self._async_flush(self._max_wait)
+            )
+
+        await asyncio.shield(future)
+
+    async def _async_flush(self, delay: float) -> None:
+        """Send all pending commands after the given delay."""
+        await asyncio.sleep(delay)
+        self._flush_task = None
+        batch = list(self._pending.values())
+        self._pending.clear()
+
+        results = await self._hass.async_add_executor_job(self._send, batch)
+        for (_, _, future), err in zip(batch, results, strict=True):
+            if future.done():
+                continue
+            if err is None:
+                future.set_result(None)
+            else:
+                future.set_exception(err)
+
+    def _send(
+        self,
+        batch: list[tuple[Callable[..., Any], tuple[Any, ...], asyncio.Future]],
+    ) -> list[Exception | None]:
+        """Send a batch of commands, collecting errors per command.
+
+        pyephember2 returns False if the MQTT publish did not complete in
+        time, which is recorded as an error too.
+        """
+        results: list[Exception | None] = []
+        with self._lock:
+            for func, args, _ in batch:
+                try:
+                    published = func(*args)
+                except Exception as err:  # noqa: BLE001
+                    _LOGGER.debug(
+                        "Error sending zone command %s: %s", func.__name__, err
+                    )
+                    results.append(err)
+                    continue
+                if not published:
+                    _LOGGER.debug("Zone command %s not published", func.__name__)
+                    results.append(
+                        HomeAssistantError(
+                            "Zone command was not published to EPH Controls"
+                        )
+                    )
+                else:
+                    results.append(None)
+        return results
@@ -2,51 +2,25 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
-from enum import IntEnum
+import datetime
 import logging
+import time
+from types import MappingProxyType
 from typing import Any
 
+from pyephember2 import pyephember2
 from pyephember2.pyephember2 import (
-    EphEmber,
+    PointIndex,
     ZoneMode,
-    ZoneCommand,
     boiler_state,
     zone_current_temperature,
     zone_is_hotwater,
     zone_is_boost_active,
-    zone_mode,
     zone_name,
     zone_target_temperature,
 )
-import requests
 import voluptuous as vol
 
-
-def _patched_set_zone_boost(self, zone, boost_temperature, num_hours, timestamp=0):
-    """Patched version of _set_zone_boost that fixes missing index argument.
-    
-    The original pyephember2 library has a bug where ZoneCommand is called
-    with only 2 arguments, but the namedtuple requires 3 (name, value, index).
-    Passing None for index allows zone_command_to_ints to fall back to
-    GetPointIndex() to determine the correct index.
-    """
-    import datetime
-    
-    # Fix: Pass None as third argument (index) - the library will use GetPointIndex fallback
-    cmds = [ZoneCommand('BOOST_HOURS', num_hours, None)]
-    if boost_temperature is not None:
-        cmds.append(ZoneCommand('BOOST_TEMP', boost_temperature, None))
-    if timestamp is not None:
-        if timestamp == 0:
-            timestamp = int(datetime.datetime.now().timestamp())
-        cmds.append(ZoneCommand('BOOST_TIME', timestamp, None))
-    return self.messenger.send_zone_commands(zone, cmds)
-
-
-# Monkey-patch the broken method in pyephember2
-EphEmber._set_zone_boost = _patched_set_zone_boost
-
 from homeassistant.components.climate import (
     PLATFORM_SCHEMA as CLIMATE_PLATFORM_SCHEMA,
     ClimateEntity,
@@ -63,26 +37,43 @@ from homeassistant.const import (
     CONF_USERNAME,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from . import EphemberConfigEntry
-from .const import DOMAIN
+from . import (
+    CONNECT_ERRORS,
+    EphemberConfigEntry,
+    EphemberCoordinator,
+    async_create_coordinator,
+)
+from .const import DOMAIN, OPTIMISTIC_TIMEOUT, EPHBoilerStates
 
 _LOGGER = logging.getLogger(__name__)
 
-# Return cached results if last scan was less then this time ago
-SCAN_INTERVAL = timedelta(seconds=120)
+# Target temperature bounds of heating zones
+MIN_TEMP = 5.0
+MAX_TEMP = 35.0
 
-OPERATION_LIST = [HVACMode.HEAT_COOL, HVACMode.HEAT, HVACMode.OFF]
+OPERATION_LIST = (HVACMode.HEAT_COOL, HVACMode.HEAT, HVACMode.OFF)
 
 PLATFORM_SCHEMA = CLIMATE_PLATFORM_SCHEMA.extend(
     {vol.Required(CONF_USERNAME): cv.string, vol.Required(CONF_PASSWORD): cv.string}
 )
 
+DEVICE_MODELS = MappingProxyType(
+    {
+        2: "Thermostat",
+        4: "Hot Water Controller",
+        514: "Hot Water Controller",
+        773: "Thermostatic Radiator Valve",
+    }
+)
+
 EPH_TO_HA_STATE = {
     "AUTO": HVACMode.HEAT_COOL,
     "ON": HVACMode.HEAT,
@@ -90,15 +81,10 @@ EPH_TO_HA_STATE = {
 }
 
 
-class EPHBoilerStates(IntEnum):
-    """Boiler states for a zone given by the api."""
-
-    FIXME = 0
-    OFF = 1
-    ON = 2
-
+# Raises KeyError at import if pyephember2 renames a zone mode
+HA_MODE_TO_ZONEMODE = {hvac: ZoneMode[eph] for eph, hvac in EPH_TO_HA_STATE.items()}
 
-HA_STATE_TO_EPH = {value: key for key, value in EPH_TO_HA_STATE.items()}
+ZONEMODE_TO_HA_MODE = {mode: hvac for hvac, mode in HA_MODE_TO_ZONEMODE.items()}
 
 
 async def async_setup_entry(
@@ -107,26 +93,18 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up EPH Controls Ember climate from a config entry."""
-    ember = entry.runtime_data
-
-    try:
-        homes = await hass.async_add_executor_job(ember.get_zones)
-    except RuntimeError:
-        _LOGGER.error("Failed to get zones from EPH Controls")
-        return
+    coordinator = entry.runtime_data
 
     entities = [
-        EphEmberThermostat(ember, zone)
-        for home in homes
-        for zone in home["zones"]
+        EphEmberThermostat(coordinator, zone) for zone in coordinator.data.values()
     ]
     async_add_entities(entities)
 
 
-def setup_platform(
+async def async_setup_platform(
     hass: HomeAssistant,
     config: ConfigType,
-    add_entities: AddEntitiesCallback,
+    async_add_entities: AddEntitiesCallback,
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up the ephember thermostat via YAML (legacy)."""
@@ -134,36 +112,33 @@ def setup_platform(
     password = config.get(CONF_PASSWORD)
 
     try:
-        ember = EphEmber(username, password)
-    except RuntimeError:
-        _LOGGER.error("Cannot login to EphEmber")
-        return
-
-    try:
-        homes = ember.get_zones()
-    except RuntimeError:
-        _LOGGER.error("Failed to get zones")
+        coordinator = await async_create_coordinator(hass, username, password)
+    except CONNECT_ERRORS:
+        _LOGGER.error("Cannot login to EphEmber or get zones")
         return
 
-    add_entities(
-        EphEmberThermostat(ember, zone) for home in homes for zone in home["zones"]
-    )
+    entities = [
+        EphEmberThermostat(coordinator, zone) for zone in coordinator.data.values()
+    ]
+    async_add_entities(entities)
 
 
-class EphEmberThermostat(ClimateEntity):
+class EphEmberThermostat(CoordinatorEntity[EphemberCoordinator], ClimateEntity):
     """Representation of a EphEmber thermostat."""
 
     _attr_hvac_modes = OPERATION_LIST
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
-    _attr_preset_modes = [PRESET_NONE, PRESET_BOOST]
+    _attr_preset_modes = (PRESET_NONE, PRESET_BOOST)
     _attr_has_entity_name = True
     _attr_name = None  # Use device name as entity name
+    _attr_min_temp = MIN_TEMP
+    _attr_max_temp = MAX_TEMP
 
-    def __init__(self, ember, zone) -> None:
+    def __init__(self, coordinator: EphemberCoordinator, zone) -> None:
         """Initialize the thermostat."""
-        self._ember = ember
+        super().__init__(coordinator)
+        self._ember = coordinator.ember
         self._zone_name = zone_name(zone)
-        self._zone = zone
         self._zone_id = zone["zoneid"]
         self._attr_unique_id = self._zone_id
 
@@ -178,6 +153,19 @@ class EphEmberThermostat(ClimateEntity):
         )
         self._attr_target_temperature_step = 0.5
 
+        # Zone dict the state attributes were last computed from
+        self._attrs_zone: dict[str, Any] | None = None
+        # Recompute from the same zone dict, e.g. once optimistic state expired
+        self._force_recompute = False
+
+        # Commanded state shown until the cloud reports it, see _update_attrs
+        self._optimistic: dict[str, Any] = {}
+        self._optimistic_until = 0.0
+        self._unsub_optimistic: CALLBACK_TYPE | None = None
+
+        # State last written, to skip writes when a poll changed nothing
+        self._last_signature: tuple | None = None
+
         # Device info for device registry
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, self._zone_id)},
@@ -186,144 +174,191 @@ class EphEmberThermostat(ClimateEntity):
             model=self._get_device_model(zone.get("deviceType")),
         )
 
+        self._update_attrs()
+
     @staticmethod
     def _get_device_model(device_type: int | None) -> str:
         """Get human-readable model name from device type code."""
-        device_models = {
-            2: "Thermostat",
-            4: "Hot Water Controller",
-            514: "Hot Water Controller",
-            773: "Thermostatic Radiator Valve",
-        }
-        return device_models.get(device_type, f"Unknown ({device_type})")
+        return DEVICE_MODELS.get(device_type, f"Unknown ({device_type})")
 
     @property
-    def preset_mode(self):
-        """Return current active preset mode."""
-        return PRESET_BOOST if zone_is_boost_active(self._zone) else PRESET_NONE
+    def _zone(self) -> dict[str, Any]:
+        """Return the latest zone data, or the last known if it went missing."""
+        return self.coordinator.data.get(self._zone_id, self._attrs_zone)
+
+    @property
+    def available(self) -> bool:
+        """Return if the zone is still reported by the EPH cloud."""
+        return super().available and self._zone_id in self.coordinator.data
+
+    def _update_attrs(self) -> None:
+        """Compute all state attributes once from the latest zone data."""
+        if self._optimistic and time.monotonic() >= self._optimistic_until:
+            self._optimistic = {}
+            self._force_recompute = True
+
+        zone = self._zone
+        # pyephember2 hands out the same dicts while its home cache is valid
+        if zone is not self._attrs_zone or self._force_recompute:
+            self._attrs_zone = zone
+            self._force_recompute = False
+
+            self._attr_current_temperature = zone_current_temperature(zone)
+            self._attr_target_temperature = zone_target_temperature(zone)
+            self._attr_hvac_mode = self.map_mode_eph_hass(pyephember2.zone_mode(zone))
+            self._attr_hvac_action = (
+                HVACAction.HEATING
+                if boiler_state(zone) == EPHBoilerStates.ON
+                else HVACAction.IDLE
+            )
+            self._attr_preset_mode = (
+                PRESET_BOOST if zone_is_boost_active(zone) else PRESET_NONE
+            )
+
+            # Hot water temp doesn't support being changed
+            if self._hot_water:
+                self._attr_min_temp = self._attr_target_temperature
+                self._attr_max_temp = self._attr_target_temperature
+
+        # The cloud may still report the old state for a while after a command
+        for key, value in self._optimistic.items():
+            setattr(self, f"_attr_{key}", value)
+
+    def _signature(self) -> tuple:
+        """Return the observable state, to detect if a write is needed."""
+        return (
+            self.available,
+            self._attr_current_temperature,
+            self._attr_target_temperature,
+            self._attr_hvac_mode,
+            self._attr_hvac_action,
+            self._attr_preset_mode,
+        )
 
-    def set_preset_mode(self, preset_mode):
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_attrs()
+        signature = self._signature()
+        if signature == self._last_signature:
+            return
+        self._last_signature = signature
+        super()._handle_coordinator_update()
+
+    async def _async_send_command(
+        self, kind: str, state: dict[str, Any], func, *args: Any
+    ) -> None:
+        """Send a command through the coordinator's batcher and refresh.
+
+        Commands use the per-zone pyephember2 methods with the zone dict
+        from the coordinator, as the public ones look the zone up with a
+        scan over all homes that may also trigger a refetch.
+
+        Once sent, the commanded ``state`` (``_attr_*`` names without the
+        prefix) is written right away and kept for OPTIMISTIC_TIMEOUT.
+        """
+        await self.coordinator.batcher.async_submit(self._zone_id, kind, func, *args)
+
+        self._optimistic.update(state)
+        self._optimistic_until = time.monotonic() + OPTIMISTIC_TIMEOUT
+        # Expire on time even if no coordinator update comes in until then
+        if self._unsub_optimistic is not None:
+            self._unsub_optimistic()
+        self._unsub_optimistic = async_call_later(
+            self.hass, OPTIMISTIC_TIMEOUT, self._async_optimistic_expired
+        )
+        self._update_attrs()
+        self._last_signature = self._signature()
+        self.async_write_ha_state()
+
+        # Refetch zone data, bypassing the library cache, to get updated state
+        await self.coordinator.async_request_resync()
+
+    @callback
+    def _async_optimistic_expired(self, _now: datetime.datetime) -> None:
+        """Drop the optimistic state and write the polled state."""
+        self._unsub_optimistic = None
+        self._optimistic_until = 0.0
+        self._update_attrs()
+        self._last_signature = self._signature()
+        self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending optimistic state expiry."""
+        if self._unsub_optimistic is not None:
+            self._unsub_optimistic()
+            self._unsub_optimistic = None
+        await super().async_will_remove_from_hass()
+
+    async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new target preset mode."""
         if preset_mode == PRESET_BOOST:
-            self._ember.activate_zone_boost(
-                self._attr_unique_id, zone_target_temperature(self._zone)
+            await self._async_send_command(
+                "preset",
+                {"preset_mode": PRESET_BOOST},
+                self._ember._set_zone_boost,
+                self._zone,
+                self._attr_target_temperature,
+                1,
             )
         else:
-            self._ember.deactivate_zone_boost(self._attr_unique_id)
-        
-        # Clear library cache and refresh zone data to get updated state
-        # Don't fail if refresh times out - the command was already sent
-        try:
-            self._ember.NextHomeUpdateDaytime = None
-            self._ember.get_zones()
-            self._zone = self._ember.get_zone(self._zone["zoneid"])
-        except (requests.exceptions.Timeout, requests.exceptions.RequestException) as err:
-            _LOGGER.debug("Timeout refreshing zone after set_preset_mode: %s", err)
-
-    @property
-    def current_temperature(self) -> float | None:
-        """Return the current temperature."""
-        return zone_current_temperature(self._zone)
-
-    @property
-    def target_temperature(self) -> float | None:
-        """Return the temperature we try to reach."""
-        return zone_target_temperature(self._zone)
-
-    @property
-    def hvac_action(self) -> HVACAction:
-        """Return current HVAC action."""
-        if boiler_state(self._zone) == EPHBoilerStates.ON:
-            return HVACAction.HEATING
-
-        return HVACAction.IDLE
-
-    @property
-    def hvac_mode(self) -> HVACMode:
-        """Return current operation ie. heat, cool, idle."""
-        mode = zone_mode(self._zone)
-        return self.map_mode_eph_hass(mode)
+            await self._async_send_command(
+                "preset",
+                {"preset_mode": PRESET_NONE},
+                self._ember._set_zone_boost,
+                self._zone,
+                None,
+                0,
+                None,
+            )
 
-    def set_hvac_mode(self, hvac_mode: HVACMode) -> None:
+    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set the operation mode."""
         mode = self.map_mode_hass_eph(hvac_mode)
         if mode is not None:
-            self._ember.set_zone_mode(self._zone["zoneid"], mode)
-            # Refresh zone data to get updated state
-            # Don't fail if refresh times out - the command was already sent
-            try:
-                self._ember.NextHomeUpdateDaytime = None
-                self._ember.get_zones()
-                self._zone = self._ember.get_zone(self._zone["zoneid"])
-            except (requests.exceptions.Timeout, requests.exceptions.RequestException) as err:
-                _LOGGER.debug("Timeout refreshing zone after set_hvac_mode: %s", err)
+            zone = self._zone
+            await self._async_send_command(
+                "mode",
+                {"hvac_mode": hvac_mode},
+                self._ember._set_zone_mode,
+                zone,
+                pyephember2.get_zone_mode_value(zone, mode),
+                pyephember2.GetPointIndex(zone, PointIndex.MODE),
+            )
         else:
             _LOGGER.error("Invalid operation mode provided %s", hvac_mode)
 
-    def set_temperature(self, **kwargs: Any) -> None:
+    async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
-        if (temperature := kwargs.get(ATTR_TEMPERATURE)) is None:
-            return
-
+        # Hot water temp doesn't support being changed
         if self._hot_water:
             return
 
-        if temperature == self.target_temperature:
+        if (temperature := kwargs.get(ATTR_TEMPERATURE)) is None:
             return
 
-        if temperature > self.max_temp or temperature < self.min_temp:
+        # Compare with the displayed target; a send that wasn't published
+        # never becomes optimistic, so a retry of it is still sent
+        if temperature == self._attr_target_temperature:
             return
 
-        self._ember.set_zone_target_temperature(self._zone["zoneid"], temperature)
-        
-        # Refresh zone data to get updated state
-        # Don't fail if refresh times out - the command was already sent
-        try:
-            self._ember.NextHomeUpdateDaytime = None
-            self._ember.get_zones()
-            self._zone = self._ember.get_zone(self._zone["zoneid"])
-        except (requests.exceptions.Timeout, requests.exceptions.RequestException) as err:
-            _LOGGER.debug("Timeout refreshing zone after set_temperature: %s", err)
-
-    @property
-    def min_temp(self) -> float:
-        """Return the minimum temperature."""
-        # Hot water temp doesn't support being changed
-        if self._hot_water:
-            return zone_target_temperature(self._zone)
-
-        return 5.0
+        if not MIN_TEMP <= temperature <= MAX_TEMP:
+            return
 
-    @property
-    def max_temp(self) -> float:
-        """Return the maximum temperature."""
-        if self._hot_water:
-            return zone_target_temperature(self._zone)
-
-        return 35.0
-
-    def update(self) -> None:
-        """Get the latest data."""
-        try:
-            self._ember.get_zones()
-            self._zone = self._ember.get_zone(self._zone["zoneid"])
-        except requests.exceptions.Timeout as err:
-            _LOGGER.debug("Timeout updating zone %s: %s", self._zone_name, err)
-        except requests.exceptions.RequestException as err:
-            _LOGGER.debug("Network error updating zone %s: %s", self._zone_name, err)
-        except (TimeoutError, OSError) as err:
-            _LOGGER.debug("Connection error updating zone %s: %s", self._zone_name, err)
-        except RuntimeError as err:
-            _LOGGER.warning("Error updating zone %s: %s", self._zone_name, err)
+        await self._async_send_command(
+            "temperature",
+            {"target_temperature": temperature},
+            self._ember._set_zone_target_temperature,
+            self._zone,
+            temperature,
+        )
 
     @staticmethod
     def map_mode_hass_eph(operation_mode):
         """Map from Home Assistant mode to eph mode."""
-        return getattr(ZoneMode, HA_STATE_TO_EPH.get(operation_mode), None)
+        return HA_MODE_TO_ZONEMODE.get(operation_mode)
 
     @staticmethod
     def map_mode_eph_hass(operation_mode):
         """Map from eph mode to Home Assistant mode."""
-        if operation_mode is None:
-            return HVACMode.HEAT_COOL
-        return EPH_TO_HA_STATE.get(operation_mode.name, HVACMode.HEAT_COOL)
+        return ZONEMODE_TO_HA_MODE.get(operation_mode, HVACMode.HEAT_COOL)
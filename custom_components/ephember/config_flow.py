@@ -23,6 +23,13 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
+def _validate(username: str, password: str) -> None:
+    """Log in and fetch the zones in one executor job."""
+    ember = EphEmber(username, password)
+    # Try to get zones to verify connection works
+    ember.get_zones()
+
+
 class EphemberConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for EPH Controls Ember."""
 
@@ -35,13 +42,12 @@ class EphemberConfigFlow(ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
+            username = user_input[CONF_USERNAME]
             # Test the credentials
             try:
-                ember = await self.hass.async_add_executor_job(
-                    EphEmber, user_input[CONF_USERNAME], user_input[CONF_PASSWORD]
+                await self.hass.async_add_executor_job(
+                    _validate, username, user_input[CONF_PASSWORD]
                 )
-                # Try to get zones to verify connection works
-                await self.hass.async_add_executor_job(ember.get_zones)
             except RuntimeError:
                 errors["base"] = "invalid_auth"
             except Exception:
@@ -49,11 +55,11 @@ class EphemberConfigFlow(ConfigFlow, domain=DOMAIN):
                 errors["base"] = "cannot_connect"
             else:
                 # Check if already configured
-                await self.async_set_unique_id(user_input[CONF_USERNAME].lower())
+                await self.async_set_unique_id(username.lower())
                 self._abort_if_unique_id_configured()
 
                 return self.async_create_entry(
-                    title=user_input[CONF_USERNAME],
+                    title=username,
                     data=user_input,
                 )
 
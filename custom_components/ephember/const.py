@@ -1,5 +1,26 @@
 """Constants for the EPH Controls Ember integration."""
 
+from datetime import timedelta
+from enum import IntEnum
+
 DOMAIN = "ephember"
 
+# Interval at which the coordinator fetches all zones from the EPH cloud
+SCAN_INTERVAL = timedelta(seconds=120)
+
+# Maximum random delay in seconds added to the scan interval
+SCAN_JITTER = 5
+
+# Delay in seconds before a refresh requested after a command is run
+REFRESH_COOLDOWN = 1.0
+
+# Seconds during which commanded state is shown over the polled state
+OPTIMISTIC_TIMEOUT = 30
+
+
+class EPHBoilerStates(IntEnum):
+    """Boiler states for a zone given by the api."""
 
+    FIXME = 0
+    OFF = 1
+    ON = 2
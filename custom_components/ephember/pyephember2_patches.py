@@ -0,0 +1,262 @@
+"""Monkey-patches for the pyephember2 library.
+
+Imported once from the integration's __init__ so the patches are in place
+before any platform uses the library.
+"""
+
+from __future__ import annotations
+
+import base64
+import datetime
+import time
+from types import MappingProxyType
+
+from pyephember2 import pyephember2
+from pyephember2.pyephember2 import (
+    EphEmber,
+    EphMessenger,
+    PointIndex,
+    ZoneCommand,
+    ZoneMode,
+)
+
+
+def _patched_set_zone_boost(self, zone, boost_temperature, num_hours, timestamp=0):
+    """Patched version of _set_zone_boost that fixes missing index argument.
+    
+    The original pyephember2 library has a bug where ZoneCommand is called
+    with only 2 arguments, but the namedtuple requires 3 (name, value, index).
+    Passing None for index allows zone_command_to_ints to fall back to
+    GetPointIndex() to determine the correct index.
+    """
+    if timestamp == 0:
+        timestamp = int(time.time())
+    # Fix: Pass None as third argument (index) - the library will use GetPointIndex fallback
+    cmds = [ZoneCommand('BOOST_HOURS', num_hours, None)]
+    cmds += [
+        ZoneCommand(name, value, None)
+        for name, value in (('BOOST_TEMP', boost_temperature), ('BOOST_TIME', timestamp))
+        if value is not None
+    ]
+    return self.messenger.send_zone_commands(zone, cmds)
+
+
+# Monkey-patch the broken method in pyephember2
+EphEmber._set_zone_boost = _patched_set_zone_boost
+
+
+def _patched_scheduletime_to_time(program, key_name):
+    """Patched version of scheduletime_to_time using integer arithmetic.
+
+    The original converts the encoded schedule time to a string and slices
+    off the last digit, which allocates on every call and fails for values
+    below 10. It runs for every program on each target temperature read of
+    a TRV in AUTO mode.
+    """
+    stime = program.get(key_name)
+    if stime is None:
+        return None
+    hours, tens = divmod(int(stime), 10)
+    return datetime.time(hours, tens * 10)
+
+
+# Monkey-patch the schedule time decoding in pyephember2
+pyephember2.scheduletime_to_time = _patched_scheduletime_to_time
+
+# Point indices that differ from the PointIndex value for a device type
+_POINT_INDEX_OVERRIDES = {
+    (PointIndex.TARGET_TEMP, 773): 12,
+    (PointIndex.MODE, 514): 11,
+    (PointIndex.MODE, 773): 11,
+    (PointIndex.BOOST_HOURS, 514): 13,
+    (PointIndex.BOOST_HOURS, 773): 13,
+}
+
+
+def _patched_get_point_index(zone, point_index):
+    """Patched version of GetPointIndex using a lookup table.
+
+    The original walks a nested match on the point and the device type for
+    every point data read. The index equals the PointIndex value except
+    for a few device types, so one dict lookup is enough.
+    """
+    return _POINT_INDEX_OVERRIDES.get(
+        (point_index, zone["deviceType"]), point_index.value
+    )
+
+
+# Monkey-patch the point index lookup in pyephember2
+pyephember2.GetPointIndex = _patched_get_point_index
+
+
+def _patched_zone_pointdata_value(zone, point_index):
+    """Patched version of zone_pointdata_value using a per-zone index.
+
+    The original scans the zone's pointDataList for every read. The list
+    is indexed by point index once and the dict is kept on the zone; zone
+    dicts are rebuilt on each fetch, so it never goes stale.
+    """
+    points = zone.get("_pointDataByIndex")
+    if points is None:
+        # Reversed so the first datum wins for a repeated index, as before
+        points = zone["_pointDataByIndex"] = {
+            datum["pointIndex"]: datum["value"]
+            for datum in reversed(zone["pointDataList"])
+        }
+    value = points.get(pyephember2.GetPointIndex(zone, point_index))
+    return None if value is None else int(value)
+
+
+# Monkey-patch the point data lookup in pyephember2
+pyephember2.zone_pointdata_value = _patched_zone_pointdata_value
+
+_original_get_zone_time = pyephember2.getZoneTime
+
+# Zone mode for each mode point value, and device types that differ
+_ZONE_MODES = {
+    0: ZoneMode.AUTO,
+    1: ZoneMode.ALL_DAY,
+    2: ZoneMode.ON,
+    3: ZoneMode.OFF,
+    4: ZoneMode.OFF,
+    9: ZoneMode.ALL_DAY,
+    10: ZoneMode.ON,
+}
+_ZONE_MODE_OVERRIDES = {
+    (1, 773): ZoneMode.ON,
+    (9, 773): ZoneMode.ON,
+}
+
+# Mode point value for each zone mode, by device type
+_ZONE_MODE_VALUES = {
+    773: {ZoneMode.AUTO: 0, ZoneMode.ON: 1, ZoneMode.OFF: 4},
+    514: {ZoneMode.AUTO: 0, ZoneMode.ALL_DAY: 9, ZoneMode.ON: 10, ZoneMode.OFF: 4},
+}
+_DEFAULT_ZONE_MODE_VALUES = {
+    ZoneMode.AUTO: 0,
+    ZoneMode.ALL_DAY: 1,
+    ZoneMode.ON: 2,
+    ZoneMode.OFF: 3,
+}
+
+
+def _patched_zone_mode(zone):
+    """Patched version of zone_mode using lookup tables.
+
+    The original resolves the mode with a nested match on the mode value
+    and device type. It is also resolved three times when reading the
+    target temperature of a TRV in AUTO mode; a zone dict is never
+    updated in place, so the result is cached on it.
+    """
+    if "_zoneMode" not in zone:
+        value = pyephember2.zone_pointdata_value(zone, PointIndex.MODE)
+        mode = _ZONE_MODE_OVERRIDES.get((value, zone["deviceType"]))
+        zone["_zoneMode"] = mode if mode is not None else _ZONE_MODES.get(value)
+    return zone["_zoneMode"]
+
+
+def _patched_get_zone_mode_value(zone, mode):
+    """Patched version of get_zone_mode_value using lookup tables."""
+    values = _ZONE_MODE_VALUES.get(zone["deviceType"], _DEFAULT_ZONE_MODE_VALUES)
+    return values.get(mode)
+
+
+def _patched_get_zone_time(zone):
+    """Patched version of getZoneTime that caches the time on the zone.
+
+    The zone timestamp is fixed per fetch, so the gmtime conversion used by
+    the schedule lookups is done once instead of on every call.
+    """
+    if "_zoneTime" not in zone:
+        zone["_zoneTime"] = _original_get_zone_time(zone)
+    return zone["_zoneTime"]
+
+
+# Monkey-patch the zone mode and time decoding in pyephember2
+pyephember2.zone_mode = _patched_zone_mode
+pyephember2.get_zone_mode_value = _patched_get_zone_mode_value
+pyephember2.getZoneTime = _patched_get_zone_time
+
+
+def _patched_first_key(programs):
+    """Patched version of firstKey that doesn't copy the keys to a list."""
+    for key in programs:
+        return key
+    # Same as the original; a StopIteration can't cross the executor future
+    raise IndexError("list index out of range")
+
+
+def _patched_last_key(programs):
+    """Patched version of lastKey that doesn't copy the keys to a list."""
+    for key in reversed(programs):
+        return key
+    raise IndexError("list index out of range")
+
+
+# Monkey-patch the dict key helpers used for schedule lookups in pyephember2
+pyephember2.firstKey = _patched_first_key
+pyephember2.lastKey = _patched_last_key
+
+# Command type ids that need the value converted before encoding
+_COMMAND_TYPE_TEMP_RW = 4
+_COMMAND_TYPE_TIMESTAMP = 5
+
+# Type id and byte length of each writable zone command
+_WRITABLE_COMMANDS = MappingProxyType(
+    {
+        "ADVANCE_ACTIVE": (1, 1),
+        "TARGET_TEMP": (_COMMAND_TYPE_TEMP_RW, 2),
+        "MODE": (1, 1),
+        "BOOST_HOURS": (1, 1),
+        "BOOST_TIME": (_COMMAND_TYPE_TIMESTAMP, 4),
+        "BOOST_TEMP": (_COMMAND_TYPE_TEMP_RW, 2),
+    }
+)
+
+
+def _zone_command_to_bytes(zone, command):
+    """Encode a ZoneCommand to the bytes sent to a zone.
+
+    Same encoding as zone_command_to_ints, but from a module-level table
+    instead of dicts rebuilt for every command.
+    """
+    try:
+        type_id, byte_len = _WRITABLE_COMMANDS[command.name]
+    except KeyError:
+        raise ValueError(f"Cannot write to read-only value {command.name}") from None
+
+    if command.index is not None:
+        command_index = command.index
+    else:
+        command_index = pyephember2.GetPointIndex(zone, PointIndex[command.name])
+
+    send_value = command.value
+    if type_id == _COMMAND_TYPE_TEMP_RW:
+        # The thermostat uses tenths of a degree
+        send_value = int(10 * send_value)
+    elif type_id == _COMMAND_TYPE_TIMESTAMP and isinstance(
+        send_value, datetime.datetime
+    ):
+        send_value = int(send_value.timestamp())
+
+    # command header: [0, index, type_id], followed by the value
+    return bytes((0, command_index, type_id)) + send_value.to_bytes(byte_len, "big")
+
+
+def _patched_send_zone_commands(self, zone, commands, stop_mqtt=True, timeout=1):
+    """Patched version of send_zone_commands that joins the encoded bytes.
+
+    The original encodes each command with zone_command_to_ints, flattens
+    the results into a list of ints and converts that back to bytes before
+    base64-encoding it.
+    """
+    if isinstance(commands, ZoneCommand):
+        commands = [commands]
+    cmd = b"".join(_zone_command_to_bytes(zone, command) for command in commands)
+    return self._zone_command_b64(
+        zone, base64.b64encode(cmd).decode("ascii"), stop_mqtt, timeout
+    )
+
+
+# Monkey-patch the zone command encoding in pyephember2
+EphMessenger.send_zone_commands = _patched_send_zone_commands